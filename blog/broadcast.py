@@ -0,0 +1,88 @@
+from channels.layers import get_channel_layer
+import asyncio
+import collections
+import logging
+import threading
+
+logger = logging.getLogger("blog")
+
+_CHANNEL_LAYER = None
+_LOOP = None
+_LOOP_LOCK = threading.Lock()
+
+# Messages waiting to be sent, appended from any thread and drained on the loop.
+_PENDING = collections.deque()
+_DRAIN_TASK = None
+
+
+def _layer():
+    """
+    Return the default channel layer, resolving it on first use only.
+    """
+    global _CHANNEL_LAYER
+    if _CHANNEL_LAYER is None:
+        _CHANNEL_LAYER = get_channel_layer()
+    return _CHANNEL_LAYER
+
+
+def _loop():
+    """
+    Return the background event loop, starting its daemon thread on first use.
+
+    A single long-lived loop is shared by every broadcast so that sending from
+    synchronous code does not build a new event loop per call.
+    """
+    global _LOOP
+    if _LOOP is None:
+        with _LOOP_LOCK:
+            if _LOOP is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="blog-broadcast", daemon=True
+                ).start()
+                _LOOP = loop
+    return _LOOP
+
+
+async def _drain():
+    """
+    Send every pending message, including those queued while sending.
+
+    Messages are sent in the order they were queued. A failed send is logged
+    and does not hold back the rest of the batch.
+    """
+    layer = _layer()
+    while _PENDING:
+        group, message = _PENDING.popleft()
+        try:
+            await layer.group_send(group, message)
+        except Exception as e:
+            logger.error(
+                "Error occurred while broadcasting to WebSocket group: %s", str(e)
+            )
+
+
+def _start_drain():
+    """
+    Start draining the pending messages unless a drain is already running.
+
+    Runs on the background loop, so the task needs no lock.
+    """
+    global _DRAIN_TASK
+    if _PENDING and (_DRAIN_TASK is None or _DRAIN_TASK.done()):
+        _DRAIN_TASK = _LOOP.create_task(_drain())
+
+
+def group_send(group, message):
+    """
+    Queue a channel layer group_send for the background event loop.
+
+    The call returns immediately. Messages queued in a burst are sent by one
+    drain task instead of one scheduled coroutine each; failures are logged.
+
+    Parameters:
+    group (str): The name of the group to send to.
+    message (dict): The channel layer message to send.
+    """
+    _PENDING.append((group, message))
+    _loop().call_soon_threadsafe(_start_drain)
@@ -1,5 +1,8 @@
 from channels.generic.websocket import AsyncWebsocketConsumer
-import json
+from django.conf import settings
+from blog.utils import dumps
+import asyncio
+import collections
 import logging
 
 logger = logging.getLogger("blog")
@@ -13,16 +16,33 @@ class BlogConsumer(AsyncWebsocketConsumer):
     messages related to blog posts and comments.
     """
 
+    GROUP_NAME = "blog_updates"
+
+    # Constant head of each outbound frame; the event data is spliced in after it.
+    _UPDATE_TMPL = '{"type":"blog_post_update",'
+    _EDIT_TMPL = '{"type":"blog_post_edit",'
+    _DELETE_TMPL = '{"type":"blog_delete_post",'
+    _COMMENT_TMPL = '{"type":"new_comment",'
+    _NOTIF_TMPL = '{"type":"notification","message":%s}'
+
     async def connect(self):
         """
         Accept the WebSocket connection and join the group for blog updates.
+
+        Also starts the writer task that flushes queued outbound frames.
         """
-        self.group_name = "blog_updates"
+        loop = asyncio.get_running_loop()
+        self._write_delay = settings.WS_WRITE_DELAY
+        self._out = collections.deque()
+        self._wake = loop.create_future()
+        self._writer_task = loop.create_task(self._writer())
+
         # Join the WebSocket group
-        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.channel_layer.group_add(self.GROUP_NAME, self.channel_name)
         await self.accept()
         logger.info(
-            f"WebSocket connection established and added to group:{self.group_name}"
+            "WebSocket connection established and added to group '%s'.",
+            self.GROUP_NAME,
         )
 
     async def disconnect(self, close_code):
@@ -32,11 +52,61 @@ class BlogConsumer(AsyncWebsocketConsumer):
         Parameters:
         close_code (int): The code indicating why the connection was closed.
         """
-        await self.channel_layer.group_discard("blog_updates", self.channel_name)
+        self._writer_task.cancel()
+        await self.channel_layer.group_discard(self.GROUP_NAME, self.channel_name)
         logger.info(
-            "WebSocket connection closed and removed from group '%s'.", self.group_name
+            "WebSocket connection closed and removed from group '%s'.", self.GROUP_NAME
         )
 
+    def _enqueue(self, frame):
+        """
+        Queue an encoded frame and wake the writer task.
+
+        Parameters:
+        frame (str): The encoded JSON frame to send.
+        """
+        self._out.append(frame)
+        if not self._wake.done():
+            self._wake.set_result(None)
+
+    @staticmethod
+    def _frame(template, data):
+        """
+        Build a frame by splicing the encoded event data into a frame template.
+
+        Parameters:
+        template (str): The constant head of the frame, ending in a comma.
+        data (dict): The non-empty event data holding the frame's remaining fields.
+
+        Returns:
+        str: The encoded JSON frame.
+        """
+        return template + dumps(data)[1:]
+
+    async def _writer(self):
+        """
+        Send queued frames, sleeping on a future until handlers enqueue more.
+
+        After waking, the writer waits ``WS_WRITE_DELAY`` seconds so that frames
+        queued during a burst go out together as a single ``batch`` frame.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._wake
+            if self._write_delay:
+                await asyncio.sleep(self._write_delay)
+            self._wake = loop.create_future()
+
+            frames = list(self._out)
+            self._out.clear()
+            if len(frames) == 1:
+                await self.send(text_data=frames[0])
+            else:
+                # Frames are already encoded, so splice them into the array as-is.
+                await self.send(
+                    text_data='{"type":"batch","events":[' + ",".join(frames) + "]}"
+                )
+
     async def blog_post_update(self, event):
         # Handle the blog_post_update message type
         """
@@ -46,19 +116,8 @@ class BlogConsumer(AsyncWebsocketConsumer):
         event (dict): The event data containing the updated post information.
         """
         data = event["data"]  # Extract the data from the event
-        await self.send(
-            text_data=json.dumps(
-                {
-                    "type": "blog_post_update",
-                    "id": data["id"],
-                    "title": data["title"],
-                    "description": data["description"],
-                    "timestamp": data["timestamp"],
-                    "status": data["status"],
-                }
-            )
-        )
-        logger.debug(f"Sent blog post update:{data}")
+        self._enqueue(self._frame(self._UPDATE_TMPL, data))
+        logger.debug("Sent blog post update: %r", data)
 
     async def blog_post_edit(self, event):
         # Handle post updates
@@ -69,19 +128,8 @@ class BlogConsumer(AsyncWebsocketConsumer):
         event (dict): The event data containing the edited post information.
         """
         data = event["data"]  # Extract the data from the event
-        await self.send(
-            text_data=json.dumps(
-                {
-                    "type": "blog_post_edit",
-                    "id": data["id"],
-                    "title": data["title"],
-                    "description": data["description"],
-                    "timestamp": data["timestamp"],
-                    "status": data["status"],
-                }
-            )
-        )
-        logger.debug(f"Sent blog post edit: {data}")
+        self._enqueue(self._frame(self._EDIT_TMPL, data))
+        logger.debug("Sent blog post edit: %r", data)
 
     async def blog_delete_post(self, event):
         # Handle the blog_delete_post message type
@@ -92,14 +140,7 @@ class BlogConsumer(AsyncWebsocketConsumer):
         event (dict): The event data containing the ID of the deleted post.
         """
         data = event["data"]
-        await self.send(
-            text_data=json.dumps(
-                {
-                    "type": "blog_delete_post",
-                    "id": data["id"],
-                }
-            )
-        )
+        self._enqueue(self._frame(self._DELETE_TMPL, data))
         logger.info("Sent notification for deleted post.")
 
     async def new_comment(self, event):
@@ -111,35 +152,27 @@ class BlogConsumer(AsyncWebsocketConsumer):
         """
         data = event["data"]
 
-        await self.send(
-            text_data=json.dumps(
-                {
-                    "type": "new_comment",
-                    "post_id": data["post_id"],
-                    "user": data["user"],
-                    "content": data["content"],
-                    "timestamp": data["timestamp"],
-                }
-            )
-        )
-        logger.debug(f"Sent new comment: {data}")
+        self._enqueue(self._frame(self._COMMENT_TMPL, data))
+        logger.debug("Sent new comment: %r", data)
 
     # New function to handle blog post notifications
     async def notification(self, event):
         """
         Handle blog post notifications and send notification messages to the WebSocket.
 
+        Producers that encode the frame themselves pass it as ``_encoded`` and it is
+        forwarded untouched; otherwise the frame is built from ``data``.
+
         Parameters:
         event (dict): The event data containing the notification message.
         """
+        encoded = event.get("_encoded")
+        if encoded:
+            self._enqueue(encoded)
+            logger.debug("Queued pre-encoded notification frame.")
+            return
+
         message = event["data"]
 
-        await self.send(
-            text_data=json.dumps(
-                {
-                    "type": "notification",
-                    "message": message,
-                }
-            )
-        )
-        logger.info(f"Sent notification message: {message}")
+        self._enqueue(self._NOTIF_TMPL % dumps(message))
+        logger.info("Sent notification message: %s", message)
@@ -1,21 +1,72 @@
-from django.db.models.signals import post_save
+from django.core.cache import cache, caches
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from django.apps import apps  # Import apps to use get_model
-from asgiref.sync import async_to_sync
-from channels.layers import get_channel_layer
+from blog import broadcast
+from blog.utils import comments_cache_key, dumps
+import functools
 import logging
 
 logger = logging.getLogger("blog")
 
 
+def _trunc(text, limit=30, ellipsis="..."):
+    """
+    Shorten text to the given length, appending an ellipsis when it was cut.
+
+    Parameters:
+    text (str): The text to shorten.
+    limit (int): The maximum number of characters to keep.
+    ellipsis (str): The suffix added when the text was truncated.
+
+    Returns:
+    str: The original text, or its first ``limit`` characters plus the ellipsis.
+    """
+    return text if len(text) <= limit else text[:limit] + ellipsis
+
+
+def notify_post_saved(post, created):
+    """
+    Schedules a notification to all users that a blog post was created or updated.
+
+    The notification message is sent to the WebSocket group for real-time
+    updates once the transaction commits. Views that write posts without
+    Model.save() call this directly.
+
+    Parameters:
+    post (Post): The post that was written.
+    created (bool): A boolean indicating whether a new record was created.
+    """
+    title = _trunc(post.title)
+    if created:
+        message = f"New post created: {title}"
+        logger.info("A new post was created: %s", message)
+    else:
+        message = f"Post updated: {title}"
+        logger.info("A post was updated: %s", message)
+
+    try:
+        # Encode the frame once here instead of once per connected consumer
+        encoded = dumps({"type": "notification", "message": message})
+        # Send the notification to all users once the post is committed
+        transaction.on_commit(
+            functools.partial(
+                broadcast.group_send,
+                "blog_updates",
+                {"type": "notification", "_encoded": encoded},
+            )
+        )
+        logger.debug("Notification scheduled for group 'blog_updates'.")
+    except Exception as e:
+        logger.error("Error occurred while sending notification: %s", str(e))
+
+
 @receiver(post_save, sender="blog.Post")
 def send_notification(sender, instance, created, **kwargs):
     """
     Sends a notification to all users when a blog post is created or updated.
 
     This function listens for the post_save signal from the Post model.
-    When a post is created or updated, it sends a notification message
-    to the WebSocket group for real-time updates.
 
     Parameters:
     sender (Model): The model class that sent the signal.
@@ -23,21 +74,74 @@ def send_notification(sender, instance, created, **kwargs):
     created (bool): A boolean indicating whether a new record was created.
     **kwargs: Additional keyword arguments.
     """
-    Post = apps.get_model("blog", "Post")  # Get the Post model dynamically
-    channel_layer = get_channel_layer()
+    notify_post_saved(instance, created)
 
-    if created:
-        message = f"New post created: {instance.title[:30]}{'...' if len(instance.title) > 30 else ''}"
-        logger.info("A new post was created: %s", message)
-    else:
-        message = f"Post updated: {instance.title[:30]}{'...' if len(instance.title) > 30 else ''}"
-        logger.info("A post was updated: %s", message)
 
+def _clear_page_cache():
+    """
+    Flush the cached pages so that they are rendered again with fresh data.
+    """
     try:
-        # Send the notification to all users
-        async_to_sync(channel_layer.group_send)(
-            "blog_updates", {"type": "notification", "data": message}
-        )
-        logger.debug("Notification sent successfully to group 'blog_updates'.")
+        caches["pages"].clear()
+        logger.debug("Page cache cleared.")
     except Exception as e:
-        logger.error("Error occurred while sending notification: %s", str(e))
+        logger.error("Error occurred while clearing the page cache: %s", str(e))
+
+
+def schedule_page_cache_clear():
+    """
+    Schedules a flush of the cached pages for when the transaction commits.
+
+    Views that write posts without Model.save() call this directly.
+    """
+    transaction.on_commit(_clear_page_cache)
+
+
+@receiver(post_save, sender="blog.Post")
+@receiver(post_delete, sender="blog.Post")
+@receiver(post_save, sender="blog.Comment")
+@receiver(post_delete, sender="blog.Comment")
+def invalidate_page_cache(sender, **kwargs):
+    """
+    Invalidates the cached pages when a blog post or comment is written.
+
+    The home page lists posts and, for signed-in users, their comments, so any
+    change to either makes the cached copies stale. The cache is cleared once
+    the transaction commits.
+
+    Parameters:
+    sender (Model): The model class that sent the signal.
+    **kwargs: Additional keyword arguments.
+    """
+    schedule_page_cache_clear()
+
+
+def _clear_comments_cache(post_id):
+    """
+    Drop the cached comments payload of a post.
+
+    Parameters:
+    post_id (int): The ID of the post whose comments changed.
+    """
+    try:
+        cache.delete(comments_cache_key(post_id))
+        logger.debug("Comments cache cleared for post ID %s.", post_id)
+    except Exception as e:
+        logger.error("Error occurred while clearing the comments cache: %s", str(e))
+
+
+@receiver(post_save, sender="blog.Comment")
+@receiver(post_delete, sender="blog.Comment")
+def invalidate_comments_cache(sender, instance, **kwargs):
+    """
+    Invalidates the cached comments of a post when one of its comments is written.
+
+    The cache entry is dropped once the transaction commits, so that the next
+    request reads the committed comments.
+
+    Parameters:
+    sender (Model): The model class that sent the signal.
+    instance (Comment): The comment that was saved or deleted.
+    **kwargs: Additional keyword arguments.
+    """
+    transaction.on_commit(functools.partial(_clear_comments_cache, instance.post_id))
@@ -4491,4 +4491,3 @@
   return index_umd;
 
 }));
-//# sourceMappingURL=bootstrap.js.map
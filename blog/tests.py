@@ -1,27 +1,56 @@
 import json
-from django.test import TestCase, Client
+import threading
+from unittest import mock
+from channels.layers import get_channel_layer
+from channels.testing import WebsocketCommunicator
+from django.db.models.signals import post_save
+from django.test import Client, SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 from django.contrib.auth.models import User
+from django.core.cache import cache, caches
+from . import broadcast
+from .consumers import BlogConsumer
 from .models import Post, Comment
+from .views import POSTS_PER_PAGE
 from .forms import PostForm  # Adjust import based on your form's location
 from django.http import JsonResponse
 
+# PBKDF2 dominates create_user time; tests don't need a strong hash.
+FAST_PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
 
+# The manifest storage needs collectstatic to have run; tests render templates
+# against the plain storage instead.
+TEST_STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+
+# Keep cached data in process memory so the tests do not need Redis.
+TEST_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "pages": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "pages",
+    },
+}
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS, STORAGES=TEST_STORAGES)
 class AddPostViewTests(TestCase):
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(username="testuser", password="testpass")
-        self.url = reverse("addpost")
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="testuser", password="testpass")
+        cls.url = reverse("addpost")
 
     def test_add_post_authenticated(self):
-        self.client.login(username="testuser", password="testpassword")
+        self.client.force_login(self.user)
         response = self.client.post(
             self.url,
             {
                 "title": "Test Post",
                 "description": "This is a test post description.",
                 "timestamp": "2024-10-04 12:00:00",  # Ensure correct format
-                "status": "Ongoing",  # Ensure it matches model choices
+                "status": "ongoing",  # Ensure it matches model choices
             },
         )
 
@@ -45,7 +74,7 @@ class AddPostViewTests(TestCase):
         self.assertRedirects(response, "/login/")  # Ensure it redirects to login page
 
     def test_add_post_invalid_form(self):
-        self.client.login(username="testuser", password="testpass")
+        self.client.force_login(self.user)
         response = self.client.post(
             self.url,
             {
@@ -63,19 +92,21 @@ class AddPostViewTests(TestCase):
         )  # Check that there are form errors
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS, STORAGES=TEST_STORAGES)
 class UpdatePostViewTests(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username="testuser", password="testpassword"
         )
-        self.post = Post.objects.create(
+        cls.post = Post.objects.create(
             title="Updated Title", description="Updated description"
         )
-        self.url = reverse("updatepost", kwargs={"id": self.post.id})
+        cls.url = reverse("updatepost", kwargs={"id": cls.post.id})
 
     def test_update_post_authenticated(self):
         # Log in the user
-        self.client.login(username="testuser", password="testpassword")
+        self.client.force_login(self.user)
 
         # Send a GET request to load the update form
         response = self.client.get(self.url)
@@ -98,7 +129,7 @@ class UpdatePostViewTests(TestCase):
         self.assertEqual(self.post.description, "Updated description")
 
     def test_update_post_invalid_form(self):
-        self.client.login(username="testuser", password="testpassword")
+        self.client.force_login(self.user)
         response = self.client.post(
             self.url, {"title": ""}
         )  # Invalid data (title is required)
@@ -110,34 +141,75 @@ class UpdatePostViewTests(TestCase):
         self.assertTrue(form.errors)
         self.assertIn("title", form.errors)
 
+    def test_update_post_saves_changes(self):
+        self.client.force_login(self.user)
+        data = {
+            "title": "Edited Title",
+            "description": "Edited description",
+            "timestamp": "2024-01-01 12:00:00",
+            "status": "ended",
+        }
+
+        saved = []
+
+        def receiver(sender, instance, **kwargs):
+            saved.append(instance)
+
+        post_save.connect(receiver, sender=Post)
+        self.addCleanup(post_save.disconnect, receiver, sender=Post)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(self.url, data)
+        self.assertRedirects(response, "/", fetch_redirect_response=False)
+
+        # The edit is a plain UPDATE, so post_save receivers are not told of a save
+        self.assertEqual(saved, [])
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.title, "Edited Title")
+        self.assertEqual(self.post.status, "ended")
+
+        # The notification and page cache flush still run alongside the edit broadcast
+        self.assertEqual(len(callbacks), 3)
+
+    def test_update_post_missing_post(self):
+        self.client.force_login(self.user)
+        url = reverse("updatepost", kwargs={"id": self.post.id + 1})
+
+        # An unknown post ID shows a 404 instead of raising a server error
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 404)
+
     def test_update_post_unauthenticated(self):
         response = self.client.get(self.url)
         self.assertRedirects(response, "/login/", fetch_redirect_response=False)
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS, STORAGES=TEST_STORAGES)
 class DeletePostViewTests(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Create a user for authentication
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username="testuser", password="testpassword"
         )
 
         # Create a sample post to be deleted
-        self.post = Post.objects.create(
+        cls.post = Post.objects.create(
             title="Test Post",
             description="Test description",
             status="Ongoing",
         )
 
+        # Define the URL for deleting the post
+        cls.url = reverse("deletepost", kwargs={"id": cls.post.id})
+
     def test_delete_post_authenticated(self):
         # Log in the user
-        self.client.login(username="testuser", password="testpassword")
-
-        # Define the URL for deleting the post
-        url = reverse("deletepost", kwargs={"id": self.post.id})
+        self.client.force_login(self.user)
 
         # Send a POST request to delete the post
-        response = self.client.post(url)
+        response = self.client.post(self.url)
 
         # Check that the user is redirected to the dashboard after a successful deletion
         self.assertRedirects(response, "/dashboard/")
@@ -146,12 +218,17 @@ class DeletePostViewTests(TestCase):
         with self.assertRaises(Post.DoesNotExist):
             Post.objects.get(pk=self.post.id)
 
-    def test_delete_post_unauthenticated(self):
-        # Define the URL for deleting the post
-        url = reverse("deletepost", kwargs={"id": self.post.id})
+    def test_delete_post_rejects_get(self):
+        self.client.force_login(self.user)
+
+        # Deletion is POST-only; other methods are refused before any work is done
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 405)
+        self.assertTrue(Post.objects.filter(pk=self.post.id).exists())
 
+    def test_delete_post_unauthenticated(self):
         # Send a POST request to delete the post without logging in
-        response = self.client.post(url)
+        response = self.client.post(self.url)
 
         # Check that the unauthenticated user is redirected to the login page
         self.assertRedirects(response, "/login/")
@@ -161,33 +238,130 @@ class DeletePostViewTests(TestCase):
         self.assertTrue(post_exists)
 
 
-class AddCommentViewTests(TestCase):
+@override_settings(
+    PASSWORD_HASHERS=FAST_PASSWORD_HASHERS, STORAGES=TEST_STORAGES, CACHES=TEST_CACHES
+)
+class HomeViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="testuser", password="testpassword"
+        )
+        Post.objects.create(
+            title="Test Post", description="Test description", status="ongoing"
+        )
+        cls.url = "/"
+
     def setUp(self):
+        # Start every test with a cold page cache
+        caches["pages"].clear()
+
+    def test_home_signed_in_page_not_served_to_anonymous(self):
+        self.client.force_login(self.user)
+        signed_in = self.client.get(self.url)
+        self.assertContains(signed_in, "View/Add Comment")
+
+        # A visitor without the session cookie gets the anonymous page
+        anonymous = Client().get(self.url)
+        self.assertNotContains(anonymous, "View/Add Comment")
+        self.assertNotEqual(anonymous.content, signed_in.content)
+
+    def test_home_anonymous_page_not_served_to_signed_in(self):
+        anonymous = self.client.get(self.url)
+        self.assertNotContains(anonymous, "View/Add Comment")
+
+        # Signing in must not return the anonymous page from the cache
+        self.client.force_login(self.user)
+        signed_in = self.client.get(self.url)
+        self.assertContains(signed_in, "View/Add Comment")
+
+    def test_home_not_reusable_by_browsers(self):
+        # Only the server-side cache can be invalidated on writes, so browsers
+        # must revalidate every time, whether the page was cached or not
+        for response in (self.client.get(self.url), self.client.get(self.url)):
+            cache_control = response["Cache-Control"]
+            self.assertIn("no-cache", cache_control)
+            self.assertIn("private", cache_control)
+            self.assertIn("max-age=0", cache_control)
+
+    def test_home_cached_per_session(self):
+        self.client.force_login(self.user)
+        # The first response sets the CSRF cookie, which changes the Cookie header
+        self.client.get(self.url)
+        first = self.client.get(self.url)
+
+        # The same session is served from the cache
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+
+        self.assertEqual(second.content, first.content)
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS, STORAGES=TEST_STORAGES)
+class DashboardViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
         # Create a user for authentication
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
+            username="testuser", password="testpassword"
+        )
+
+        # Create one more post than fits on a page
+        Post.objects.bulk_create(
+            Post(title=f"Post {i}", description="Test description", status="ongoing")
+            for i in range(POSTS_PER_PAGE + 1)
+        )
+
+        cls.url = reverse("dashboard")
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_dashboard_first_page(self):
+        response = self.client.get(self.url)
+
+        # The first page is full and links to the next one
+        self.assertEqual(len(response.context["posts"]), POSTS_PER_PAGE)
+        self.assertTrue(response.context["page_obj"].has_next())
+
+    def test_dashboard_last_page(self):
+        response = self.client.get(self.url, {"page": 2})
+
+        # The remaining post lands on the second page
+        self.assertEqual(len(response.context["posts"]), 1)
+        self.assertFalse(response.context["page_obj"].has_next())
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS, STORAGES=TEST_STORAGES)
+class AddCommentViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Create a user for authentication
+        cls.user = User.objects.create_user(
             username="testuser", password="testpassword"
         )
 
         # Create a sample post to add comments to
-        self.post = Post.objects.create(
+        cls.post = Post.objects.create(
             title="Test Post",
             description="Test description",
             status="Ongoing",
         )
 
+        # Define the URL for adding a comment
+        cls.url = reverse("add_comment")
+
+    def setUp(self):
         # Log in the user
-        self.client.login(username="testuser", password="testpassword")
+        self.client.force_login(self.user)
 
     def test_add_comment_success(self):
-        # Define the URL for adding a comment
-        url = reverse("add_comment")
-
         # Define the data to be sent in the POST request
         data = {"post_id": self.post.id, "content": "This is a test comment."}
 
         # Send a POST request to add the comment
         response = self.client.post(
-            url, data=json.dumps(data), content_type="application/json"
+            self.url, data=json.dumps(data), content_type="application/json"
         )
 
         # Check that the response status code is 200
@@ -203,31 +377,49 @@ class AddCommentViewTests(TestCase):
         ).exists()
         self.assertTrue(comment_exists)
 
+    def test_add_comment_missing_post(self):
+        data = {"post_id": self.post.id + 1, "content": "This is a test comment."}
 
+        # Commenting on an unknown post is refused without saving anything
+        response = self.client.post(
+            self.url, data=json.dumps(data), content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(Comment.objects.exists())
+
+
+@override_settings(
+    PASSWORD_HASHERS=FAST_PASSWORD_HASHERS, STORAGES=TEST_STORAGES, CACHES=TEST_CACHES
+)
 class GetCommentsViewTests(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Create a user for authentication
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username="testuser", password="testpassword"
         )
 
         # Create a sample post to add comments to
-        self.post = Post.objects.create(
+        cls.post = Post.objects.create(
             title="Test Post",
             description="Test description",
             status="Ongoing",
         )
 
         # Create some comments for the post
-        Comment.objects.create(post=self.post, user=self.user, content="First comment")
-        Comment.objects.create(post=self.post, user=self.user, content="Second comment")
+        Comment.objects.create(post=cls.post, user=cls.user, content="First comment")
+        Comment.objects.create(post=cls.post, user=cls.user, content="Second comment")
 
-    def test_get_comments_success(self):
         # Define the URL for getting comments, passing the post ID as an argument
-        url = reverse("get_comments", args=[self.post.id])
+        cls.url = reverse("get_comments", args=[cls.post.id])
 
+    def setUp(self):
+        # Start every test with a cold comments cache
+        cache.clear()
+
+    def test_get_comments_success(self):
         # Send a GET request to retrieve comments for the post
-        response = self.client.get(url)
+        response = self.client.get(self.url)
 
         # Check that the response status code is 200
         self.assertEqual(response.status_code, 200)
@@ -242,6 +434,41 @@ class GetCommentsViewTests(TestCase):
         self.assertEqual(response_data["comments"][0]["content"], "Second comment")
         self.assertEqual(response_data["comments"][1]["content"], "First comment")
 
+        # Timestamps keep the "YYYY-MM-DD HH:MM:SS" format the client expects
+        first = Comment.objects.get(content="First comment")
+        self.assertEqual(
+            response_data["comments"][1]["timestamp"],
+            first.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+        )
+
+    def test_get_comments_single_query(self):
+        # Comment authors are joined in, not fetched one query per comment
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_get_comments_cached(self):
+        first = self.client.get(self.url)
+
+        # A repeated request is served from the cache without touching the database
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+
+        self.assertEqual(second.content, first.content)
+
+    def test_get_comments_cache_invalidated_on_new_comment(self):
+        self.client.get(self.url)
+
+        # The cached payload is dropped once the new comment is committed
+        with self.captureOnCommitCallbacks(execute=True):
+            Comment.objects.create(
+                post=self.post, user=self.user, content="Third comment"
+            )
+
+        response_data = json.loads(self.client.get(self.url).content)
+        self.assertEqual(len(response_data["comments"]), 3)
+
     def test_get_comments_no_comments(self):
         # Create a new post with no comments
         new_post = Post.objects.create(
@@ -266,63 +493,91 @@ class GetCommentsViewTests(TestCase):
         self.assertEqual(response_data["comments"], [])
 
 
-class GetCommentsViewTests(TestCase):
-    def setUp(self):
-        # Create a user for authentication
-        self.user = User.objects.create_user(
-            username="testuser", password="testpassword"
-        )
+@override_settings(
+    CHANNEL_LAYERS={"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}
+)
+class BlogConsumerTests(SimpleTestCase):
+    async def test_single_event_is_sent_unbatched(self):
+        communicator = WebsocketCommunicator(BlogConsumer.as_asgi(), "/ws/blog/")
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
 
-        # Create a sample post to add comments to
-        self.post = Post.objects.create(
-            title="Test Post",
-            description="Test description",
-            status="Ongoing",
+        await get_channel_layer().group_send(
+            "blog_updates", {"type": "blog_delete_post", "data": {"id": 1}}
         )
 
-        # Create some comments for the post
-        Comment.objects.create(post=self.post, user=self.user, content="First comment")
-        Comment.objects.create(post=self.post, user=self.user, content="Second comment")
+        # A lone event goes out as its own frame
+        response = await communicator.receive_json_from()
+        self.assertEqual(response, {"type": "blog_delete_post", "id": 1})
 
-    def test_get_comments_success(self):
-        # Define the URL for getting comments, passing the post ID as an argument
-        url = reverse("get_comments", args=[self.post.id])
+        await communicator.disconnect()
 
-        # Send a GET request to retrieve comments for the post
-        response = self.client.get(url)
+    async def test_burst_is_sent_as_single_batch(self):
+        communicator = WebsocketCommunicator(BlogConsumer.as_asgi(), "/ws/blog/")
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
 
-        # Check that the response status code is 200
-        self.assertEqual(response.status_code, 200)
+        # Both events land within the write delay window
+        channel_layer = get_channel_layer()
+        await channel_layer.group_send(
+            "blog_updates", {"type": "blog_delete_post", "data": {"id": 1}}
+        )
+        await channel_layer.group_send(
+            "blog_updates", {"type": "blog_delete_post", "data": {"id": 2}}
+        )
 
-        # Parse the response content
-        response_data = json.loads(response.content)
+        # Verify that they arrive together in one batch frame
+        response = await communicator.receive_json_from()
+        self.assertEqual(response["type"], "batch")
+        self.assertEqual([event["id"] for event in response["events"]], [1, 2])
 
-        # Verify that the response contains the correct number of comments
-        self.assertEqual(len(response_data["comments"]), 2)
+        await communicator.disconnect()
 
-        # Verify that the content of the comments matches what was added
-        self.assertEqual(response_data["comments"][0]["content"], "Second comment")
-        self.assertEqual(response_data["comments"][1]["content"], "First comment")
+    async def test_pre_encoded_notification_is_forwarded(self):
+        communicator = WebsocketCommunicator(BlogConsumer.as_asgi(), "/ws/blog/")
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
 
-    def test_get_comments_no_comments(self):
-        # Create a new post with no comments
-        new_post = Post.objects.create(
-            title="New Post",
-            description="New post description",
-            status="Ongoing",
+        encoded = '{"type":"notification","message":"New post created: Test"}'
+        await get_channel_layer().group_send(
+            "blog_updates", {"type": "notification", "_encoded": encoded}
         )
 
-        # Define the URL for getting comments for the new post
-        url = reverse("get_comments", args=[new_post.id])
+        # Verify that the producer's frame is sent as-is
+        response = await communicator.receive_from()
+        self.assertEqual(response, encoded)
 
-        # Send a GET request to retrieve comments for the new post
-        response = self.client.get(url)
+        await communicator.disconnect()
 
-        # Check that the response status code is 200
-        self.assertEqual(response.status_code, 200)
 
-        # Parse the response content
-        response_data = json.loads(response.content)
+class RecordingChannelLayer:
+    """
+    Channel layer stand-in that records group sends and fails on request.
+    """
 
-        # Verify that the response contains an empty list of comments
-        self.assertEqual(response_data["comments"], [])
+    def __init__(self, expected):
+        self.sent = []
+        self.expected = expected
+        self.done = threading.Event()
+
+    async def group_send(self, group, message):
+        if message.get("fail"):
+            raise RuntimeError("Redis is down")
+        self.sent.append((group, message["data"]))
+        if len(self.sent) == self.expected:
+            self.done.set()
+
+
+class BroadcastTests(SimpleTestCase):
+    def test_queued_messages_are_sent_in_order(self):
+        layer = RecordingChannelLayer(expected=2)
+        with mock.patch.object(broadcast, "_CHANNEL_LAYER", layer):
+            with self.assertLogs("blog", level="ERROR") as logs:
+                broadcast.group_send("blog_updates", {"data": 1})
+                broadcast.group_send("blog_updates", {"data": 2, "fail": True})
+                broadcast.group_send("blog_updates", {"data": 3})
+                self.assertTrue(layer.done.wait(timeout=1))
+
+        # A failed send is logged without holding back the ones after it
+        self.assertEqual(layer.sent, [("blog_updates", 1), ("blog_updates", 3)])
+        self.assertIn("Redis is down", logs.output[0])
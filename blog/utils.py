@@ -0,0 +1,108 @@
+from django.http import HttpResponse
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder when orjson is unavailable.
+    import json
+
+    orjson = None
+
+
+if orjson is not None:
+    _dumpb = orjson.dumps
+
+    def dumps(obj):
+        """
+        Serialize an object to a compact JSON string using orjson.
+
+        Parameters:
+        obj (Any): The JSON-serializable object to encode.
+
+        Returns:
+        str: The encoded JSON document.
+        """
+        return orjson.dumps(obj).decode()
+
+    def loads(data):
+        """
+        Parse a JSON document using orjson.
+
+        Parameters:
+        data (bytes | str): The JSON document to parse.
+
+        Returns:
+        Any: The decoded object.
+        """
+        return orjson.loads(data)
+
+else:
+
+    def _dumpb(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def dumps(obj):
+        """
+        Serialize an object to a compact JSON string using the stdlib encoder.
+
+        Parameters:
+        obj (Any): The JSON-serializable object to encode.
+
+        Returns:
+        str: The encoded JSON document.
+        """
+        return json.dumps(obj, separators=(",", ":"))
+
+    def loads(data):
+        """
+        Parse a JSON document using the stdlib decoder.
+
+        Parameters:
+        data (bytes | str): The JSON document to parse.
+
+        Returns:
+        Any: The decoded object.
+        """
+        return json.loads(data)
+
+
+def comments_cache_key(post_id):
+    """
+    Build the cache key under which a post's comments payload is stored.
+
+    Parameters:
+    post_id (int | str): The ID of the post.
+
+    Returns:
+    str: The cache key.
+    """
+    return f"post:{post_id}:comments:v1"
+
+
+def format_timestamp(value):
+    """
+    Format a datetime as "YYYY-MM-DD HH:MM:SS" for the client.
+
+    Same output as ``strftime("%Y-%m-%d %H:%M:%S")`` without parsing a format
+    string; the slice drops the UTC offset that aware datetimes append.
+
+    Parameters:
+    value (datetime): The datetime to format.
+
+    Returns:
+    str: The formatted timestamp.
+    """
+    return value.isoformat(sep=" ", timespec="seconds")[:19]
+
+
+def json_response(payload, status=200):
+    """
+    Build a JSON HTTP response, encoding the payload straight to bytes.
+
+    Parameters:
+    payload (dict): The JSON-serializable response body.
+    status (int): The HTTP status code of the response.
+
+    Returns:
+    HttpResponse: The response carrying the encoded payload.
+    """
+    return HttpResponse(_dumpb(payload), status=status, content_type="application/json")
@@ -1,26 +1,65 @@
-from channels.layers import get_channel_layer
-from asgiref.sync import async_to_sync
-from django.http import JsonResponse
-from django.shortcuts import render, HttpResponseRedirect
+from django.shortcuts import get_object_or_404, render, HttpResponseRedirect
+from django.http import HttpResponse
 from .forms import SignUpForm, LoginForm, PostForm
 from django.contrib import messages
 from django.contrib.auth import authenticate, login, logout
 from .models import Post, Comment
+from blog import broadcast
+from blog.signals import notify_post_saved, schedule_page_cache_clear
+from blog.utils import comments_cache_key, format_timestamp, json_response, loads
 from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.views.decorators.cache import cache_control, cache_page
+from django.views.decorators.vary import vary_on_cookie
+from django.views import View
 from django.views.decorators.http import require_POST
 from django.contrib.auth.decorators import login_required
-import json
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db import transaction
+from django.db.models import Prefetch
+import functools
 import logging
 
 logger = logging.getLogger("blog")
 
+# Number of posts rendered per page on the home and dashboard pages.
+POSTS_PER_PAGE = 20
 
+# Seconds an encoded comments payload stays cached; comment writes also clear it.
+COMMENTS_CACHE_TIMEOUT = 60
+
+
+@functools.lru_cache(maxsize=1)
+def _author_group_id():
+    """
+    Return the primary key of the "Author" group, looking it up once per process.
+
+    The group is set up once through the admin and is not expected to change; a
+    process restart picks up a group that was recreated.
+
+    Returns:
+    int: The ID of the "Author" group.
+    """
+    return Group.objects.values_list("id", flat=True).get(name="Author")
+
+
+# vary_on_cookie has to run before cache_page builds the cache key; the Vary
+# header SessionMiddleware adds comes too late for it, so without this every
+# visitor would share whichever user's page was cached first. cache_control
+# wraps the cache so that browsers revalidate instead of reusing a page that
+# only the server-side cache gets invalidated for.
+@cache_control(private=True, no_cache=True, max_age=0)
+@cache_page(60 * 5, cache="pages")
+@vary_on_cookie
 def home(request):
     """
     Displays the home page of the blog application.
 
-    This function retrieves all blog posts from the database and renders the home page template,
-    passing the list of posts as a context variable.
+    This function retrieves one page of blog posts from the database and renders the home page
+    template, passing the page of posts as a context variable. For authenticated users the posts' comments
+    and their authors are prefetched, since the template renders them for those users only.
+    The rendered page is cached per session cookie until a post or comment changes.
 
     Parameters:
     request (HttpRequest): The HTTP request object that contains metadata about the request.
@@ -28,19 +67,36 @@ def home(request):
     Returns:
     HttpResponse: A response to render the home page template with the list of blog posts.
     """
+    user = request.user
+    is_authenticated = user.is_authenticated
     logger.info(
-        f"User {request.user.username} is authenticated and trying to add a post."
+        "User %s accessed the home page.",
+        user.username if is_authenticated else "Anonymous",
     )
 
     try:
         posts = Post.objects.all().order_by("-timestamp")
-        logger.debug(f"Successfully retrieved {posts.count()} posts from the database.")
+        if is_authenticated:
+            # Only signed-in users see the comment sections, so only they need them
+            posts = posts.prefetch_related(
+                Prefetch(
+                    "comments",
+                    queryset=Comment.objects.select_related("user").only(
+                        "post", "content", "timestamp", "user__username"
+                    ),
+                )
+            )
+        logger.debug("Successfully built the blog post query.")
     except Exception as e:
-        logger.error(f"An error occurred while retrieving blog posts:{str(e)}")
+        logger.error("An error occurred while retrieving blog posts:%s", e)
 
-    return render(request, "blog/home.html", {"posts": posts})
+    page_obj = Paginator(posts, POSTS_PER_PAGE).get_page(request.GET.get("page"))
+    return render(request, "blog/home.html", {"posts": page_obj, "page_obj": page_obj})
 
 
+@cache_control(private=True, no_cache=True, max_age=0)
+@cache_page(60 * 60, cache="pages")
+@vary_on_cookie
 def about(request):
     """
     Renders the about page.
@@ -53,13 +109,17 @@ def about(request):
     Returns:
     HttpResponse: A response that renders the about page.
     """
+    user = request.user
     logger.info(
         "User %s accessed the about page.",
-        request.user.username if request.user.is_authenticated else "Anonymous",
+        user.username if user.is_authenticated else "Anonymous",
     )
     return render(request, "blog/about.html")
 
 
+@cache_control(private=True, no_cache=True, max_age=0)
+@cache_page(60 * 60, cache="pages")
+@vary_on_cookie
 def contact(request):
     """
     Renders the contact page.
@@ -72,8 +132,10 @@ def contact(request):
     Returns:
     HttpResponse: A response that renders the contact page.
     """
+    user = request.user
     logger.info(
-        f"User {'Anonymous' if not request.user.is_authenticated else request.user.username} accessed the contact page."
+        "User %s accessed the contact page.",
+        user.username if user.is_authenticated else "Anonymous",
     )
 
     return render(request, "blog/contact.html")
@@ -84,7 +146,7 @@ def dashboard(request):
     Renders the dashboard page for authenticated users.
 
     This view checks if the user is authenticated. If authenticated, it retrieves
-    all blog posts, the user's full name, and their group memberships, and renders
+    one page of blog posts, the user's full name, and their group memberships, and renders
     the dashboard page. If the user is not authenticated, they are redirected to the login page.
 
     Parameters:
@@ -94,17 +156,23 @@ def dashboard(request):
     HttpResponse: A response that renders the dashboard page with user-specific information if authenticated.
     HttpResponseRedirect: A redirect to the login page if the user is unauthenticated.
     """
-    if request.user.is_authenticated:
-        logger.info(f"User {request.user.username} accessed the dashboard page.")
+    user = request.user
+    if user.is_authenticated:
+        logger.info("User %s accessed the dashboard page.", user.username)
 
-        posts = Post.objects.all()
-        user = request.user
+        posts = Post.objects.only("id", "title", "description").order_by("-timestamp")
+        page_obj = Paginator(posts, POSTS_PER_PAGE).get_page(request.GET.get("page"))
         full_name = user.get_full_name()
-        groups = user.groups.all()
+        groups = list(user.groups.only("name"))
         return render(
             request,
             "blog/dashboard.html",
-            {"posts": posts, "full_name": full_name, "groups": groups},
+            {
+                "posts": page_obj,
+                "page_obj": page_obj,
+                "full_name": full_name,
+                "groups": groups,
+            },
         )
     else:
         logger.warning("Unauthenticated user tried to access the dashboard page.")
@@ -133,10 +201,10 @@ def user_signup(request):
             logger.debug("Sign-up form is valid. Creating a new user.")
             messages.success(request, "Congratulation !! You have become an author.")
             user = form.save()
-            group = Group.objects.get(name="Author")
-            user.groups.add(group)
+            user.groups.add(_author_group_id())
             logger.info(
-                f"User {user.username} signed up successfully and added to 'Author' group."
+                "User %s signed up successfully and added to 'Author' group.",
+                user.username,
             )
             return HttpResponseRedirect("/")
     else:
@@ -171,7 +239,7 @@ def user_login(request):
                 user = authenticate(username=user_name, password=user_password)
                 if user is not None:
                     login(request, user)
-                    logger.info(f"User {user.username} logged in successfully.")
+                    logger.info("User %s logged in successfully.", user.username)
                     messages.success(request, "LoggedIn successfully")
                     return HttpResponseRedirect("/dashboard/")
         else:
@@ -180,7 +248,8 @@ def user_login(request):
         return render(request, "blog/login.html", {"form": form})
     else:
         logger.info(
-            f"User {request.user.username} is already authenticated. Redirecting to dashboard."
+            "User %s is already authenticated. Redirecting to dashboard.",
+            request.user.username,
         )
         return HttpResponseRedirect("/dashboard/")
 
@@ -198,8 +267,9 @@ def user_logout(request):
     HttpResponseRedirect: A redirect to the home page after successful logout.
     """
 
-    if request.user.is_authenticated:
-        logger.info(f"User {request.user.username} is logging out.")
+    user = request.user
+    if user.is_authenticated:
+        logger.info("User %s is logging out.", user.username)
     else:
         logger.warning("Unauthenticated user tried to access the logout view.")
 
@@ -208,67 +278,94 @@ def user_logout(request):
     return HttpResponseRedirect("/")
 
 
-def add_post(request):
+class LoginRedirectMixin(LoginRequiredMixin):
+    """
+    Redirects unauthenticated users to the login page, logging the attempt.
     """
-    Handles adding a new blog post.
 
-    This view checks if the user is authenticated and handles GET and POST requests.
-    If the request is a GET request, it displays the form for adding a new post.
-    If the request is a POST request, it processes the form data to add the post,
-    validates the form, saves the post, and broadcasts the post to a WebSocket group
-    for real-time updates.
+    login_url = "/login/"
+    redirect_field_name = None
 
-    Parameters:
-    request (HttpRequest): The HTTP request object that contains metadata about the request.
+    def handle_no_permission(self):
+        logger.warning("Unauthenticated user tried to access %s.", self.request.path)
+        return super().handle_no_permission()
 
-    Returns:
-    HttpResponse: A response to render the add post form on a GET request.
-    HttpResponseRedirect: A redirect to the home page after successfully adding a post, or
-                          a redirect to the login page if the user is unauthenticated.
+
+class AddPostView(LoginRedirectMixin, View):
     """
-    if request.user.is_authenticated:
-        logger.info(
-            "User %s is authenticated and trying to add a post.", request.user.username
-        )
-        if request.method == "POST":
-            logger.debug("Handling POST request for adding a post.")
-            form = PostForm(request.POST)
-            if form.is_valid():
-                logger.debug("Post form is valid. Extracting form data.")
-                title = form.cleaned_data["title"]
-                description = form.cleaned_data["description"]
-                timestamp = form.cleaned_data["timestamp"]
-                status = form.cleaned_data["status"]
-                post = Post(
-                    title=title,
-                    description=description,
-                    timestamp=timestamp,
-                    status=status,
-                )
+    Handles adding a new blog post.
 
-                try:
-                    post.save()
-                    logger.info(
-                        "Post titled '%s' added successfully by user %s.",
-                        title,
-                        request.user.username,
-                    )
-                except Exception as e:
-                    logger.error("Error occurred while saving post: %s", str(e))
-                    return render(
-                        request,
-                        "blog/addpost.html",
-                        {
-                            "form": form,
-                            "error": "An error occurred while saving the post.",
-                        },
-                    )
+    A GET request displays the form for adding a new post. A POST request
+    validates the form, saves the post, and broadcasts the post to a WebSocket
+    group for real-time updates. Unauthenticated users are redirected to the
+    login page.
+    """
+
+    def get(self, request):
+        """
+        Displays the form for adding a new post.
+
+        Parameters:
+        request (HttpRequest): The HTTP request object that contains metadata about the request.
 
-                # Broadcast the new post to the WebSocket group
-                logger.debug("Broadcasting the new post to the WebSocket group.")
-                channel_layer = get_channel_layer()
-                try:
-                    async_to_sync(channel_layer.group_send)(
+        Returns:
+        HttpResponse: A response to render the add post form.
+        """
+        logger.debug("Handling GET request for displaying the add post form.")
+        form = PostForm()
+        return render(request, "blog/addpost.html", {"form": form})
+
+    def post(self, request):
+        """
+        Saves a new post from the submitted form and broadcasts it.
+
+        Parameters:
+        request (HttpRequest): The HTTP request object that contains metadata about the request.
+
+        Returns:
+        HttpResponse: A response to render the add post form again if it is invalid.
+        HttpResponseRedirect: A redirect to the home page after successfully adding a post.
+        """
+        user = request.user
+        logger.info("User %s is authenticated and trying to add a post.", user.username)
+        form = PostForm(request.POST)
+        if form.is_valid():
+            logger.debug("Post form is valid. Extracting form data.")
+            title = form.cleaned_data["title"]
+            description = form.cleaned_data["description"]
+            timestamp = form.cleaned_data["timestamp"]
+            status = form.cleaned_data["status"]
+            post = Post(
+                title=title,
+                description=description,
+                timestamp=timestamp,
+                status=status,
+            )
+
+            try:
+                post.save()
+                logger.info(
+                    "Post titled '%s' added successfully by user %s.",
+                    title,
+                    user.username,
+                )
+            except Exception as e:
+                logger.error("Error occurred while saving post: %s", str(e))
+                return render(
+                    request,
+                    "blog/addpost.html",
+                    {
+                        "form": form,
+                        "error": "An error occurred while saving the post.",
+                    },
+                )
+
+            # Broadcast the new post to the WebSocket group
+            logger.debug("Broadcasting the new post to the WebSocket group.")
+            try:
+                transaction.on_commit(
+                    functools.partial(
+                        broadcast.group_send,
                         "blog_updates",
                         {
                             "type": "blog_post_update",  # Ensure this matches the consumer's method name
@@ -276,75 +373,97 @@ def add_post(request):
                                 "id": post.id,
                                 "title": post.title,
                                 "description": post.description,
-                                "timestamp": post.timestamp.strftime(
-                                    "%Y-%m-%d %H:%M:%S"
-                                ),
+                                "timestamp": format_timestamp(post.timestamp),
                                 "status": post.status,
                             },
                         },
                     )
-                    logger.info(
-                        "Successfully broadcasted post titled '%s' to WebSocket group.",
-                        title,
-                    )
-                except Exception as e:
-                    logger.error(
-                        "Error occurred while broadcasting the post: %s", str(e)
-                    )
-
-                return HttpResponseRedirect("/")
-            else:
-                logger.warning(
-                    "Form data is not valid. User %s attempted to submit an invalid form.",
-                    request.user.username,
                 )
-        else:
-            logger.debug("Handling GET request for displaying the add post form.")
-            form = PostForm()
+                logger.info(
+                    "Scheduled broadcast of post titled '%s' to WebSocket group.",
+                    title,
+                )
+            except Exception as e:
+                logger.error("Error occurred while broadcasting the post: %s", str(e))
+
+            return HttpResponseRedirect("/")
+
+        logger.warning(
+            "Form data is not valid. User %s attempted to submit an invalid form.",
+            user.username,
+        )
         return render(request, "blog/addpost.html", {"form": form})
-    else:
-        logger.warning("Unauthenticated user tried to access the add post page.")
-        return HttpResponseRedirect("/login/")
 
 
-def update_post(request, id):
+class UpdatePostView(LoginRedirectMixin, View):
     """
     Handles updating an existing blog post.
 
-    This view allows an authenticated user to update an existing blog post.
-    If the request is a POST, it validates and saves the form data and broadcasts the update via WebSocket.
-    If the request is a GET, it displays the form with the existing post data.
+    A GET request displays the form with the existing post data, or responds
+    with 404 if the post does not exist. A POST request validates the form data,
+    writes it with a single UPDATE, and broadcasts the update via WebSocket.
+    Unauthenticated users are redirected to the login page.
+    """
+
+    def get(self, request, id):
+        """
+        Displays the update form for a post.
 
-    Parameters:
-    request (HttpRequest): The HTTP request object that contains metadata about the request.
-    id (int): The ID of the post to be updated.
+        Parameters:
+        request (HttpRequest): The HTTP request object that contains metadata about the request.
+        id (int): The ID of the post to be updated.
 
-    Returns:
-    HttpResponse: A response to render the update post form.
-    HttpResponseRedirect: A redirect to the dashboard after successful update.
-    """
-    if request.user.is_authenticated:
+        Returns:
+        HttpResponse: A response to render the update post form.
+        """
         logger.info(
-            f"User {request.user.username} is attempting to update post with ID {id}."
+            "Handling GET request to display the update form for post with ID %s.",
+            id,
         )
-        if request.method == "POST":
-            try:
-                post = Post.objects.get(pk=id)
-            except Post.DoesNotExist:
-                logger.error(f"Post with ID {id} does not exist.")
-                return HttpResponseRedirect("/dashboard/")
-            logger.info(f"Handling POST request to update post with ID {id}.")
-            form = PostForm(request.POST, instance=post)
-            if form.is_valid():
-                logger.debug("Update form is valid. Saving post.")
-                form.save()
+        post = get_object_or_404(Post, pk=id)
+        form = PostForm(instance=post)
+        return render(request, "blog/updatepost.html", {"form": form})
 
-                logger.debug(
-                    f"Broadcasting updated post with ID {post.id} to the WebSocket group."
-                )
-                channel_layer = get_channel_layer()
-                try:
-                    async_to_sync(channel_layer.group_send)(
+    def post(self, request, id):
+        """
+        Saves the submitted changes to a post and broadcasts them.
+
+        Parameters:
+        request (HttpRequest): The HTTP request object that contains metadata about the request.
+        id (int): The ID of the post to be updated.
+
+        Returns:
+        HttpResponse: A response to render the update post form again if it is invalid.
+        HttpResponseRedirect: A redirect after a successful update, or to the dashboard
+                              if the post does not exist.
+        """
+        logger.info(
+            "User %s is attempting to update post with ID %s.",
+            request.user.username,
+            id,
+        )
+        form = PostForm(request.POST)
+        if form.is_valid():
+            logger.debug("Update form is valid. Saving post.")
+            with transaction.atomic():
+                # A single UPDATE writes the row without reading it first
+                if not Post.objects.filter(pk=id).update(**form.cleaned_data):
+                    logger.error("Post with ID %s does not exist.", id)
+                    return HttpResponseRedirect("/dashboard/")
+                post = Post(id=id, **form.cleaned_data)
+                # QuerySet.update() sends no post_save, so do the work of its
+                # receivers here.
+                notify_post_saved(post, created=False)
+                schedule_page_cache_clear()
+
+            logger.debug(
+                "Broadcasting updated post with ID %s to the WebSocket group.",
+                post.id,
+            )
+            try:
+                transaction.on_commit(
+                    functools.partial(
+                        broadcast.group_send,
                         "blog_updates",
                         {
                             "type": "blog_post_edit",  # Ensure this matches the consumer's method name
@@ -352,70 +471,67 @@ def update_post(request, id):
                                 "id": post.id,
                                 "title": post.title,
                                 "description": post.description,
-                                "timestamp": post.timestamp.strftime(
-                                    "%Y-%m-%d %H:%M:%S"
-                                ),
+                                "timestamp": format_timestamp(post.timestamp),
                                 "status": post.status,
                             },
                         },
                     )
-                    logger.info(
-                        f"Successfully broadcasted updated post with ID {post.id} to WebSocket group."
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Error occurred while broadcasting updated post: {str(e)}"
-                    )
-                # return HttpResponseRedirect("/dashboard/")
-                return HttpResponseRedirect("/")
-        else:
-            logger.info(
-                f"Handling GET request to display the update form for post with ID {id}."
-            )
-            post = Post.objects.get(pk=id)
-            form = PostForm(instance=post)
+                )
+                logger.info(
+                    "Scheduled broadcast of updated post with ID %s to WebSocket group.",
+                    post.id,
+                )
+            except Exception as e:
+                logger.error("Error occurred while broadcasting updated post: %s", e)
+            # return HttpResponseRedirect("/dashboard/")
+            return HttpResponseRedirect("/")
+
         return render(request, "blog/updatepost.html", {"form": form})
-    else:
-        logger.warning("Unauthenticated user tried to access the update post view.")
-        return HttpResponseRedirect("/login/")
 
 
-def delete_post(request, id):
+class DeletePostView(LoginRedirectMixin, View):
     """
     Handles the deletion of a blog post.
 
-    This view allows an authenticated user to delete an existing blog post.
-    If the request is a POST, it deletes the specified post and broadcasts the deletion via WebSocket.
+    Only POST is accepted; it deletes the specified post and broadcasts the
+    deletion via WebSocket. Other methods get a 405 response, and
+    unauthenticated users are redirected to the login page.
+    """
 
-    Parameters:
-    request (HttpRequest): The HTTP request object that contains metadata about the request.
-    id (int): The ID of the post to be deleted.
+    def post(self, request, id):
+        """
+        Deletes a post and broadcasts the deletion.
 
-    Returns:
-    HttpResponseRedirect: A redirect to the dashboard after successful deletion.
-    """
-    if request.user.is_authenticated:
+        Parameters:
+        request (HttpRequest): The HTTP request object that contains metadata about the request.
+        id (int): The ID of the post to be deleted.
+
+        Returns:
+        HttpResponseRedirect: A redirect to the dashboard after successful deletion.
+        """
         logger.info(
-            f"User {request.user.username} is attempting to delete post with ID {id}."
+            "User %s is attempting to delete post with ID %s.",
+            request.user.username,
+            id,
         )
-        if request.method == "POST":
-
+        with transaction.atomic():
             try:
-                post = Post.objects.get(pk=id)
+                post = Post.objects.select_for_update().get(pk=id)
             except Post.DoesNotExist:
-                logger.error(f"Post with ID {id} does not exist.")
+                logger.error("Post with ID %s does not exist.", id)
                 return HttpResponseRedirect("/dashboard/")
 
             post.delete()
 
-            logger.info(f"Post with ID {id} deleted successfully.")
-            # Broadcast the delete post to the WebSocket group
-            logger.debug(
-                f"Broadcasting deletion of post with ID {id} to the WebSocket group."
-            )
-            channel_layer = get_channel_layer()
-            try:
-                async_to_sync(channel_layer.group_send)(
+        logger.info("Post with ID %s deleted successfully.", id)
+        # Broadcast the delete post to the WebSocket group
+        logger.debug(
+            "Broadcasting deletion of post with ID %s to the WebSocket group.", id
+        )
+        try:
+            transaction.on_commit(
+                functools.partial(
+                    broadcast.group_send,
                     "blog_updates",  # Use the same group name as in the consumer
                     {
                         "type": "blog_delete_post",  # Ensure this matches the consumer's method name
@@ -424,17 +540,14 @@ def delete_post(request, id):
                         },
                     },
                 )
-                logger.info(
-                    f"Successfully broadcasted deletion of post with ID {id} to WebSocket group."
-                )
-            except Exception as e:
-                logger.error(
-                    f"Error occurred while broadcasting deletion of post: {str(e)}"
-                )
-            return HttpResponseRedirect("/dashboard/")
-    else:
-        logger.warning("Unauthenticated user tried to access the delete post view.")
-        return HttpResponseRedirect("/login/")
+            )
+            logger.info(
+                "Scheduled broadcast of deletion of post with ID %s to WebSocket group.",
+                id,
+            )
+        except Exception as e:
+            logger.error("Error occurred while broadcasting deletion of post: %s", e)
+        return HttpResponseRedirect("/dashboard/")
 
 
 @login_required
@@ -451,63 +564,64 @@ def add_comment(request):
     request (HttpRequest): The HTTP request object containing the comment data.
 
     Returns:
-    JsonResponse: A JSON response indicating the success or failure of the comment addition.
+    HttpResponse: A JSON response indicating the success or failure of the comment addition.
     """
     # Get data from POST request
-    data = json.loads(request.body)
+    data = loads(request.body)
     post_id = data.get("post_id")
     content = data.get("content")
 
     # Validate input
     if not post_id or not content:
         logger.warning("Invalid input: post_id or content is missing.")
-        return JsonResponse({"error": "Invalid input"}, status=400)
+        return json_response({"error": "Invalid input"}, status=400)
 
     # Save comment to the database
+    user = request.user
 
     try:
-        post = Post.objects.get(id=post_id)
-        comment = Comment(post=post, user=request.user, content=content)
+        # Only the post's existence matters; the comment refers to it by ID
+        if not Post.objects.filter(id=post_id).exists():
+            logger.error("Post with ID %s does not exist.", post_id)
+            return json_response({"error": "Post not found"}, status=404)
+        comment = Comment(post_id=post_id, user=user, content=content)
         comment.save()
-    except Post.DoesNotExist:
-        logger.error(f"Post with ID {post_id} does not exist.")
-        return JsonResponse({"error": "Post not found"}, status=404)
     except Exception as e:
-        logger.error(f"Error occurred while saving comment: {str(e)}")
-        return JsonResponse({"error": "Failed to add comment"}, status=500)
+        logger.error("Error occurred while saving comment: %s", e)
+        return json_response({"error": "Failed to add comment"}, status=500)
 
     # Broadcast comment to WebSocket group
-    channel_layer = get_channel_layer()
-
+    timestamp = format_timestamp(comment.timestamp)
     # Debugging log
     logger.debug(
         "Broadcasting new comment to WebSocket group.",
         extra={
             "post_id": post_id,
-            "user": request.user.username,
+            "user": user.username,
             "content": content,
-            "timestamp": comment.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": timestamp,
         },
     )
 
-    async_to_sync(channel_layer.group_send)(
-        "blog_updates",
-        {
-            "type": "new_comment",
-            "data": {
-                "post_id": post_id,
-                "user": request.user.username,
-                "content": content,
-                "timestamp": comment.timestamp.strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                ),  # Assuming Comment model has timestamp
+    transaction.on_commit(
+        functools.partial(
+            broadcast.group_send,
+            "blog_updates",
+            {
+                "type": "new_comment",
+                "data": {
+                    "post_id": post_id,
+                    "user": user.username,
+                    "content": content,
+                    "timestamp": timestamp,
+                },
             },
-        },
+        )
     )
 
-    logger.info("New comment broadcasted successfully.")
+    logger.info("New comment broadcast scheduled.")
 
-    return JsonResponse({"message": "Comment added successfully"})
+    return json_response({"message": "Comment added successfully"})
 
 
 def get_comments(request, post_id):
@@ -516,30 +630,47 @@ def get_comments(request, post_id):
 
     This view fetches all comments associated with the specified post ID,
     orders them by timestamp in descending order, and returns them as a JSON response.
+    The encoded response body is cached per post until a comment on it changes.
 
     Parameters:
     request (HttpRequest): The HTTP request object.
     post_id (int): The ID of the blog post for which comments are to be retrieved.
 
     Returns:
-    JsonResponse: A JSON response containing the list of comments for the specified post.
+    HttpResponse: A JSON response containing the list of comments for the specified post.
     """
-    comments = Comment.objects.filter(post_id=post_id).order_by("-timestamp")
+    key = comments_cache_key(post_id)
+    payload = cache.get(key)
+    if payload is not None:
+        logger.debug("Serving cached comments for post ID %s.", post_id)
+        return HttpResponse(payload, content_type="application/json")
+
+    # Only the three columns are needed, so rows come back as plain tuples
+    # instead of Comment and User instances.
+    rows = list(
+        Comment.objects.filter(post_id=post_id)
+        .order_by("-timestamp")
+        .values_list("user__username", "content", "timestamp")
+    )
 
-    if not comments.exists():
-        logger.warning(f"No comments found for post ID {post_id}.")
-        return JsonResponse(
+    if not rows:
+        logger.warning("No comments found for post ID %s.", post_id)
+        response = json_response(
             {"comments": []}
         )  # Return an empty list if no comments are found.
+        cache.set(key, response.content, COMMENTS_CACHE_TIMEOUT)
+        return response
 
     comments_data = [
         {
-            "user": comment.user.username,
-            "content": comment.content,
-            "timestamp": comment.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+            "user": username,
+            "content": content,
+            "timestamp": format_timestamp(timestamp),
         }
-        for comment in comments
+        for username, content, timestamp in rows
     ]
 
-    logger.info(f"Retrieved {len(comments_data)} comments for post ID {post_id}.")
-    return JsonResponse({"comments": comments_data})
+    logger.info("Retrieved %s comments for post ID %s.", len(comments_data), post_id)
+    response = json_response({"comments": comments_data})
+    cache.set(key, response.content, COMMENTS_CACHE_TIMEOUT)
+    return response
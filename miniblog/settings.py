@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.0/ref/settings/
 """
 
 from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
 
 import os
 import dotenv
@@ -30,6 +31,9 @@ DEBUG = os.getenv("DEBUG")
 # Set Logger level in .env file.
 LOGGER_LEVEL = os.getenv("LOGGER_LEVEL")
 
+# Seconds a WebSocket connection waits to batch queued frames into one.
+WS_WRITE_DELAY = float(os.getenv("WS_WRITE_DELAY", "0.01"))
+
 ALLOWED_HOSTS = ['*']
 
 
@@ -49,6 +53,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -63,8 +68,18 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [os.path.join(BASE_DIR, "templates")],
-        "APP_DIRS": True,
         "OPTIONS": {
+            # Compiled templates are kept in memory; the dev autoreloader resets
+            # this cache when a template file changes.
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
@@ -114,12 +129,69 @@ LOGGING = {
 }
 
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+# PostgreSQL is used when DB_NAME is set (as in docker-compose); otherwise the
+# local SQLite file is. Persistent connections are not safe under ASGI, so
+# PostgreSQL connections are reused through psycopg's pool instead.
+if os.getenv("DB_NAME"):
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.getenv("DB_NAME"),
+            "USER": os.getenv("DB_USER", "postgres"),
+            "PASSWORD": os.getenv("DB_PASSWORD", ""),
+            "HOST": os.getenv("DB_HOST", "postgres"),
+            "PORT": os.getenv("DB_PORT", "5432"),
+            "OPTIONS": {"pool": True},
+        }
+    }
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": BASE_DIR / "db.sqlite3",
+            # WAL lets readers carry on while a write is in progress.
+            "OPTIONS": {
+                "init_command": "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;",
+            },
+        }
+    }
+
+
+# Cache rendered pages in their own cache so that they can be flushed on writes
+# without touching other cached data. Redis is used when REDIS_URL is set (as
+# in docker-compose); otherwise each process keeps its own in-memory caches.
+# The caches always use databases 1 and 2, whatever database REDIS_URL names.
+REDIS_URL = os.getenv("REDIS_URL", "")
+
+
+def _redis_db_url(db):
+    """
+    Return REDIS_URL pointed at the given Redis database number.
+    """
+    return urlunsplit(urlsplit(REDIS_URL)._replace(path=f"/{db}"))
+
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": _redis_db_url(1),
+        },
+        "pages": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": _redis_db_url(2),
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+        "pages": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "pages",
+        },
     }
-}
 
 
 # Password validation
@@ -158,9 +230,22 @@ USE_TZ = True
 
 STATIC_URL = "/static/"
 
-STATICFILES_DIRS = [
-    "/home/user/Documents/LIVE_BLOG/Blog_App/miniblog/blog/static/",
-]
+# blog/static is picked up by the app directories finder; collectstatic
+# gathers it here for WhiteNoise to serve.
+STATIC_ROOT = BASE_DIR / "staticfiles"
+
+# Serve compressed files under content-hashed names. WhiteNoise already marks
+# hashed files as cacheable forever; WHITENOISE_MAX_AGE covers the rest.
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
+
+WHITENOISE_MAX_AGE = 60 * 60 * 24 * 365
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
@@ -170,13 +255,14 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 ASGI_APPLICATION = "miniblog.asgi.application"
 
 
-# Configure the Channel Layer to use Redis
+# Configure the Channel Layer to use Redis. The pub/sub layer fans group
+# messages out with native Redis PUBLISH instead of per-channel lists.
 CHANNEL_LAYERS = {
     "default": {
-        "BACKEND": "channels_redis.core.RedisChannelLayer",
+        "BACKEND": "channels_redis.pubsub.RedisPubSubChannelLayer",
         "CONFIG": {
-            #"hosts": [("127.0.0.1", 6379)],
-            "hosts": [("redis", 6379)],       
-                  },
-               }
-            }
\ No newline at end of file
+            # Pub/sub is not tied to a database, so REDIS_URL is used as given.
+            "hosts": [REDIS_URL or "redis://redis:6379"],
+        },
+    }
+}